@@ -0,0 +1,121 @@
+"""
+Compiled kernels for the hot loops over coalition bitmasks.
+Numba is an optional dependency. If it is not installed, NUMBA_AVAILABLE is False and
+the games fall back to their NumPy implementations.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def can_compile(*arrays: np.ndarray) -> bool:
+    """
+    Returns whether the kernels can be applied to the given arrays.
+    This requires Numba and numeric arrays, since arbitrary precision integers are stored as Python objects,
+    which cannot be compiled.
+    """
+    return NUMBA_AVAILABLE and all(array.dtype != object for array in arrays)
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def is_convex_kernel(v: np.ndarray) -> bool:
+        """
+        Checks v(C union D) + v(C intersection D) >= v(C) + v(D) for all pairs of coalitions C, D,
+        where v denotes the characteristic function indexed by coalition bitmasks.
+        """
+        num_masks = v.shape[0]
+        # Flag shared by all threads, such that the remaining coalitions are skipped once a violation is found.
+        violation_found = np.zeros(1, dtype=np.bool_)
+        for C in prange(1, num_masks):
+            if violation_found[0]:
+                continue
+            for D in range(C, num_masks):
+                if v[C | D] + v[C & D] < v[C] + v[D]:
+                    violation_found[0] = True
+                    break
+        return not violation_found[0]
+
+    @njit(parallel=True, cache=True)
+    def is_additive_kernel(v: np.ndarray) -> bool:
+        """
+        Checks v(A) + v(B) = v(A union B) for all pairs of disjoint coalitions A, B,
+        where v denotes the characteristic function indexed by coalition bitmasks.
+        """
+        num_masks = v.shape[0]
+        grand_coalition = num_masks - 1
+        # Flag shared by all threads, such that the remaining coalitions are skipped once a violation is found.
+        violation_found = np.zeros(1, dtype=np.bool_)
+        for A in prange(1, num_masks):
+            if violation_found[0]:
+                continue
+            # Enumerate all non empty subsets B of the complement of A.
+            complement = grand_coalition ^ A
+            B = complement
+            while B > 0:
+                if v[A] + v[B] != v[A | B]:
+                    violation_found[0] = True
+                    break
+                B = (B - 1) & complement
+        return not violation_found[0]
+
+    @njit(parallel=True, cache=True)
+    def coalition_weights_kernel(weights: np.ndarray, masks: np.ndarray) -> np.ndarray:
+        """Returns the sum of weights of every coalition given by its bitmask."""
+        n = weights.shape[0]
+        coalition_weights = np.zeros(masks.shape[0], dtype=weights.dtype)
+        for c in prange(masks.shape[0]):
+            mask = masks[c]
+            total = weights[0] * 0
+            for i in range(n):
+                if (mask >> i) & 1:
+                    total += weights[i]
+            coalition_weights[c] = total
+        return coalition_weights
+
+    @njit(parallel=True, cache=True)
+    def marginal_contribution_sums_kernel(v: np.ndarray, masks: np.ndarray, sizes: np.ndarray,
+                                          size_weights: np.ndarray) -> np.ndarray:
+        """
+        Returns for every player i the sum of w(|C|) * (v(C union {i}) - v(C)) over the given coalitions C without
+        player i, where v denotes the characteristic function indexed by coalition bitmasks and w the size weights.
+        """
+        n = size_weights.shape[0]
+        sums = np.zeros(n, dtype=size_weights.dtype)
+        for i in prange(n):
+            player_bit = 1 << i
+            total = size_weights[0] * 0
+            for c in range(masks.shape[0]):
+                C = masks[c]
+                if C & player_bit:
+                    continue
+                total += size_weights[sizes[c]] * (v[C | player_bit] - v[C])
+            sums[i] = total
+        return sums
+
+    @njit(parallel=True, cache=True)
+    def average_marginal_contributions_kernel(v: np.ndarray, masks: np.ndarray) -> np.ndarray:
+        """
+        Returns for every coalition T given by its bitmask the average marginal contribution of its members,
+        i.e. (sum_{j in T} v(T) - v(T \\ {j})) / |T|.
+        """
+        averages = np.zeros(masks.shape[0])
+        for c in prange(masks.shape[0]):
+            T = masks[c]
+            remaining = T
+            T_len = 0
+            A = 0.0
+            # Iterate over the set bits of the coalition by isolating the lowest one.
+            while remaining > 0:
+                j_bit = remaining & -remaining
+                A += v[T] - v[T ^ j_bit]
+                T_len += 1
+                remaining ^= j_bit
+            averages[c] = A / T_len
+        return averages
@@ -1,9 +1,58 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from itertools import chain, combinations
-from typing import List, Dict, Tuple, Optional
+from math import ceil, comb
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Tuple, Optional
 import numpy as np
 from scipy.optimize import linprog
-from scipy.special import binom
+from cooperative_games import _kernels
+
+# Maximum number of coalition pairs processed at once by the vectorized pairwise checks.
+_MAX_BLOCK_ELEMENTS = 1 << 16
+
+
+@lru_cache(maxsize=1 << 16)
+def _mask_to_tuple(mask: int) -> Tuple:
+    """Returns the sorted coalition tuple of the players 1, ..., n represented by a bitmask."""
+    return tuple(i + 1 for i in range(mask.bit_length()) if (mask >> i) & 1)
+
+
+@lru_cache(maxsize=8)
+def _build_masks(n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the bitmasks of all coalitions of n players, their sizes and their membership matrix.
+    The arrays are shared between games and are therefore read-only.
+    """
+    # Popcount and bit reversal tables of all masks 0, ..., 2^n - 1, which are built by doubling the tables for
+    # every additional bit k, i.e. sizes[m | 1 << k] = sizes[m] + 1 for all m < 2^k.
+    sizes = np.zeros((1,), dtype=np.int8)
+    reversed_masks = np.zeros((1,), dtype=np.int64)
+    for k in range(n):
+        sizes = np.concatenate((sizes, sizes + 1))
+        reversed_masks = np.concatenate((reversed_masks, reversed_masks + (1 << (n - 1 - k))))
+    masks = np.arange(1, 1 << n, dtype=np.int64)
+
+    # Coalitions are ordered by size and lexicographically within a size, just like the powerset.
+    # The lexicographic order corresponds to a descending order of the masks with reversed bits,
+    # i.e. with the first player being the most significant bit.
+    order = np.lexsort((-reversed_masks[1:], sizes[1:]))
+    masks = masks[order]
+    sizes = sizes[1:][order]
+    membership = BaseGame._masks_to_membership(masks, n)
+    for array in (masks, sizes, membership):
+        array.setflags(write=False)
+    return masks, sizes, membership
+
+
+@lru_cache(maxsize=16)
+def _make_game(game_class: type, contributions: Tuple, contribution_types: Tuple) -> "Game":
+    """
+    Returns a game of the given class for a tuple of contributions, which is shared by all equal requests.
+    The types of the contributions are part of the key, since equal numbers of different types, e.g. 1 and 1.0,
+    result in games with different contribution types.
+    """
+    return game_class(list(contributions))
 
 
 class BaseGame(ABC):
@@ -13,12 +62,17 @@ class BaseGame(ABC):
 
     def __init__(self, contributions: List[int]) -> None:
         """Base constructor for all derived classes."""
-        if not contributions:
+        if len(contributions) == 0:
             raise ValueError("No contributions provided.")
 
         self._players = []
-        self._coalitions = []
+        self._coalitions = None
         self._contributions = []
+        self._contributions_array = np.zeros((0,))
+        self._mask_arrays = None
+        self._size_offsets = None
+        self._characteristic_function = None
+        self._characteristic_values = None
 
     def __repr__(self) -> str:
         num_players = len(self.players)
@@ -33,7 +87,9 @@ class BaseGame(ABC):
 
     @property
     def coalitions(self) -> List[Tuple]:
-        """Property for coalitions field."""
+        """Property for coalitions field. The coalition tuples are only built once they are requested."""
+        if self._coalitions is None:
+            self._coalitions = self._init_coalitions()
         return self._coalitions
 
     @property
@@ -42,8 +98,8 @@ class BaseGame(ABC):
         return self._contributions
 
     @abstractmethod
-    def characteristic_function(self) -> Dict[Tuple, int]:
-        """Returns the characteristic function of the game."""
+    def characteristic_function(self) -> Mapping[Tuple, int]:
+        """Returns the characteristic function of the game as a read-only mapping."""
         pass
 
     def _init_coalitions(self) -> List[Tuple]:
@@ -51,13 +107,183 @@ class BaseGame(ABC):
         powerset = self.__powerset(self.players)
         return powerset
 
+    @property
+    def _masks(self) -> np.ndarray:
+        """
+        Property for the bitmasks of all coalitions, aligned with the coalitions of the current game.
+        In the bitmask of a coalition, bit i - 1 is set iff player i is part of the coalition, such that
+        union, intersection and removal of players become single integer operations.
+        """
+        return self._get_mask_arrays()[0]
+
+    @property
+    def _sizes(self) -> np.ndarray:
+        """Property for the sizes of all coalitions, aligned with the coalitions of the current game."""
+        return self._get_mask_arrays()[1]
+
+    def _get_mask_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the bitmasks, sizes and membership matrix of all coalitions.
+        They hold O(n * 2^n) values, such that they are only built once they are requested.
+        """
+        if self._mask_arrays is None:
+            # The masks only depend on the number of players, such that they are shared between all games of that size.
+            self._mask_arrays = _build_masks(len(self.players))
+        return self._mask_arrays
+
+    @staticmethod
+    def _coalition_to_mask(coalition: Tuple) -> int:
+        """Returns the bitmask representing a coalition."""
+        mask = 0
+        for player in coalition:
+            mask |= 1 << (player - 1)
+        return mask
+
+    @staticmethod
+    def _masks_to_membership(masks: np.ndarray, n: int) -> np.ndarray:
+        """
+        Returns a boolean matrix of shape (number of masks, n), where entry (c, i) denotes whether bit i is set in the
+        c-th mask. All bits are tested at once by a broadcast and against the single bit masks of the players.
+        """
+        return (masks[:, None] & (1 << np.arange(n, dtype=np.int64))) != 0
+
+    def _get_membership_matrix(self) -> np.ndarray:
+        """
+        Returns a boolean matrix of shape (number of coalitions, number of players),
+        where entry (c, i) denotes whether player i + 1 is part of the c-th coalition.
+        """
+        return self._get_mask_arrays()[2]
+
+    def _get_size_offsets(self) -> np.ndarray:
+        """
+        Returns the offsets of the coalition sizes within the coalitions of the game, such that
+        all coalitions of size k are located between the offsets k - 1 and k.
+        The number of coalitions of size k is given by the binomial coefficient of k out of all players.
+        """
+        if self._size_offsets is None:
+            n = len(self.players)
+            self._size_offsets = np.cumsum([0] + [comb(n, k) for k in range(1, n + 1)])
+        return self._size_offsets
+
+    def _mask_to_coalition(self, mask: int) -> Tuple:
+        """Returns the coalition represented by a bitmask."""
+        return _mask_to_tuple(mask)
+
+    def _get_coalitions_at(self, indices) -> List[Tuple]:
+        """
+        Returns the coalitions at the given indices.
+        If the coalitions have not been requested yet, only the selected coalitions are converted from their bitmasks.
+        """
+        if self._coalitions is not None:
+            return [self._coalitions[i] for i in indices]
+        return [self._mask_to_coalition(mask) for mask in self._masks[indices].tolist()]
+
+    def _get_characteristic_values(self) -> np.ndarray:
+        """
+        Returns the characteristic function of the game as a dense array indexed by coalition bitmasks.
+        The empty coalition (mask 0) is included with a payoff of 0.
+        """
+        if self._characteristic_values is None:
+            values = self._get_coalition_values()
+            v = np.zeros((1 << len(self.players),), dtype=values.dtype)
+            v[self._masks] = values
+            self._characteristic_values = v
+        return self._characteristic_values
+
+    def _get_coalition_values(self) -> np.ndarray:
+        """Returns the payoffs of all coalitions as an array aligned with the coalitions of the game."""
+        return np.asarray(list(self.characteristic_function().values()))
+
+    def _get_marginal_contribution_sums(self, size_weights: np.ndarray, include_empty_coalition: bool = False) -> np.ndarray:
+        """
+        Returns for every player i the sum of w(|C|) * (v(C union {i}) - v(C)) over all coalitions C without player i, where
+            - v denotes the characteristic function of the game.
+            - w denotes the given weights, indexed by the size of a coalition.
+        The empty coalition is only considered if requested.
+        """
+        v = self._get_characteristic_values()
+        size_weights = np.asarray(size_weights)
+        if self._may_overflow_int64(v, size_weights):
+            # Sum with arbitrary precision integers, such that the sums stay exact.
+            v = v.astype(object)
+            size_weights = size_weights.astype(object)
+
+        if _kernels.can_compile(v, size_weights):
+            masks = self._masks
+            sizes = self._sizes
+            if include_empty_coalition:
+                masks = np.concatenate(([0], masks))
+                sizes = np.concatenate(([0], sizes)).astype(self._sizes.dtype)
+            size_weights = size_weights.astype(np.result_type(v, size_weights))
+            return _kernels.marginal_contribution_sums_kernel(v, masks, sizes, size_weights)
+
+        n = len(self.players)
+        sums = np.zeros((n,), dtype=np.result_type(v, size_weights))
+        # The marginal contribution of a player to a coalition containing it is 0, such that the sums can run over all
+        # coalitions without selecting those without the player. The grand coalition contains all players and is skipped.
+        C = self._masks[:-1]
+        weights = size_weights[self._sizes[:-1]]
+        for i in range(n):
+            player_bit = 1 << i
+            sums[i] = np.dot(weights, v[C | player_bit] - v[C])
+        if include_empty_coalition:
+            # The union of the empty coalition with a player is the player's one coalition.
+            sums += size_weights[0] * v[1 << np.arange(n)]
+        return sums
+
+    def _may_overflow_int64(self, v: np.ndarray, size_weights: np.ndarray) -> bool:
+        """
+        Returns whether the weighted sums of marginal contributions of integer payoffs v and integer weights w
+        may exceed the range of 64 bit integers. A marginal contribution is bounded by 2 * max |v|, and every weight
+        w(k) occurs for the comb(n - 1, k) coalitions of size k without a player.
+        """
+        if not (np.issubdtype(v.dtype, np.integer) and np.issubdtype(size_weights.dtype, np.integer)):
+            return False
+        n = len(self.players)
+        # Evaluate the bound with arbitrary precision integers, since it may exceed the range of 64 bit integers itself.
+        max_payoff = max(abs(int(v.max())), abs(int(v.min())))
+        max_weight_sum = sum(abs(w) * comb(n - 1, k) for k, w in enumerate(size_weights.tolist()))
+        return 2 * max_payoff * max_weight_sum > np.iinfo(np.int64).max
+
+    def _get_shapley_weights(self) -> np.ndarray:
+        """
+        Returns the weights |C|! * (n - |C| - 1)! of the shapley value for the coalition sizes |C| = 0, ..., n - 1.
+        The weights are integers, such that weighted sums of integer payoffs are exact before dividing by n!.
+        Weighted sums, which may exceed the range of 64 bit integers, are evaluated with arbitrary precision integers.
+        """
+        n = len(self.players)
+        # Lookup table of the factorials 0!, ..., n!.
+        factorials = [1]
+        for k in range(1, n + 1):
+            factorials.append(factorials[-1] * k)
+        weights = [factorials[k] * factorials[n - k - 1] for k in range(n)]
+        # The weights themselves exceed the range of 64 bit integers for more than 20 players.
+        return np.array(weights, dtype=np.int64 if n <= 20 else object)
+
+    def _get_average_marginal_contributions(self) -> np.ndarray:
+        """
+        Returns for every coalition T of the game the average marginal contribution of a member of T, i.e.
+        A(T) = (sum_{j in T} (v(T) - v(T \\ {j})) / |T|, where
+            - v denotes the characteristic function of the game.
+        """
+        v = self._get_characteristic_values()
+        if _kernels.can_compile(v):
+            return _kernels.average_marginal_contributions_kernel(v, self._masks)
+
+        membership = self._get_membership_matrix()
+        A = np.zeros((len(self._masks),))
+        for j in range(len(self.players)):
+            T = self._masks[membership[:, j]]
+            A[membership[:, j]] += v[T] - v[T ^ (1 << j)]
+        return A / self._sizes
+
     def __powerset(self, elements: List) -> List[Tuple]:
         """Returns the powerset from a given list."""
         return list(chain.from_iterable(combinations(elements, r) for r in range(1, len(elements) + 1)))
 
     def get_one_coalitions(self) -> List[tuple]:
         """Returns a list of one coalitions exisiting in the current game."""
-        return [coalition for coalition in self.coalitions if len(coalition) == 1]
+        return self._get_coalitions_at(np.flatnonzero(self._sizes == 1))
 
 
 class Game(BaseGame):
@@ -67,7 +293,9 @@ class Game(BaseGame):
         """Creates a new instance of this class."""
         super().__init__(contributions)
 
-        if any(contribution for contribution in contributions if contribution < 0):
+        # The contributions are kept as passed, while all computations use them as a numpy array.
+        contributions_array = np.asarray(contributions)
+        if (contributions_array < 0).any():
             raise ValueError("Contributions have to be greater than or equal to 0.")
 
         num_players = np.log2(len(contributions) + 1)
@@ -76,29 +304,45 @@ class Game(BaseGame):
         num_players = int(num_players)
 
         self._players = [i for i in range(1, num_players + 1)]
-        self._coalitions = self._init_coalitions()
 
-        if not self.__check_if_contributions_are_monotone(contributions):
+        if not self.__check_if_contributions_are_monotone(contributions_array):
             raise ValueError("Contributions have to grow monotone by coalition size.")
 
         self._contributions = contributions
+        self._contributions_array = contributions_array
+
+    @classmethod
+    def from_contributions(cls, contributions: List[int]) -> "Game":
+        """
+        Returns a game for the given contributions.
+        Games are shared between calls with equal contributions of equal types, such that the coalitions and all
+        cached results are only computed once. The returned game must therefore not be modified.
+        The 16 most recently requested games are kept alive together with their cached results, which hold
+        O(n * 2^n) values each.
+        """
+        contributions = tuple(contributions)
+        return _make_game(cls, contributions, tuple(type(contribution) for contribution in contributions))
 
     def __repr__(self) -> str:
         repr = super().__repr__()
         max_contribs_to_show = 32
         contribs_to_show = min(max_contribs_to_show, len(self.contributions))
-        repr += "contributions = ["
-        for i in range(contribs_to_show):
-            if i == contribs_to_show - 1:
-                repr += f"{self.contributions[i]}"
-            else:
-                repr += f"{self.contributions[i]}, "
-        repr += "]"
+        repr += "contributions = [" + ", ".join(map(str, self.contributions[:contribs_to_show])) + "]"
         return repr
 
-    def characteristic_function(self) -> Dict:
+    def characteristic_function(self) -> Mapping[Tuple, int]:
         """Returns the characteristic of this TU game."""
-        return {coalition: contribution for coalition, contribution in zip(self.coalitions, self.contributions)}
+        # The characteristic function only depends on the contributions, so build it once and reuse it.
+        # It is returned as a read-only view, such that callers cannot modify the cached payoffs. Only the dict is
+        # cached, since views cannot be pickled.
+        if self._characteristic_function is None:
+            self._characteristic_function = {coalition: contribution for coalition, contribution in
+                                             zip(self.coalitions, self.contributions)}
+        return MappingProxyType(self._characteristic_function)
+
+    def _get_coalition_values(self) -> np.ndarray:
+        """Returns the payoffs of all coalitions, which are the contributions aligned with the coalitions of the game."""
+        return self._contributions_array
 
     def get_marginal_contribution(self, coalition: Tuple, player: int) -> int:
         """Returns the marginal contribution for a player in a coalition."""
@@ -113,17 +357,13 @@ class Game(BaseGame):
         if player not in coalition:
             raise ValueError("Player is not part of coalition.")
 
-        characteristic_function = self.characteristic_function()
-        coalition_payoff = characteristic_function[coalition]
-
-        # If coalition only consists of one player, return payoff of the coalition function directly.
-        if len(coalition) == 1:
-            return coalition_payoff
-
-        coalition_without_player = tuple(filter(lambda x: x != player, coalition))
-        coalition_without_player_payoff = characteristic_function[coalition_without_player]
+        return self._get_marginal_contribution(self._coalition_to_mask(coalition), player)
 
-        return coalition_payoff - coalition_without_player_payoff
+    def _get_marginal_contribution(self, mask: int, player: int) -> int:
+        """Returns the marginal contribution for a player in a coalition given by its bitmask."""
+        # Removing the player clears its bit. For a one player coalition this yields the empty coalition with payoff 0.
+        v = self._get_characteristic_values()
+        return (v[mask] - v[mask & ~(1 << (player - 1))]).item()
 
     def get_utopia_payoff_vector(self) -> np.ndarray:
         """
@@ -133,24 +373,25 @@ class Game(BaseGame):
             - v denotes the characteristic function of the game.
             - N denotes the grand coalition.
         """
-        N = self.coalitions[-1]
-        v = self.characteristic_function()
+        v = self._get_characteristic_values()
         n = len(self.players)
-        v_N = v[N]
-        M = np.zeros((n,))
-        for i, player in enumerate(self.players):
-            N_without_i = tuple(sorted(p for p in N if p != player))
-            v_N_without_i = v[N_without_i] if N_without_i in v else 0
-            M[i] = v_N - v_N_without_i
-        return M
+        N = (1 << n) - 1
+        # Removing player i from the grand coalition clears bit i - 1, where the empty coalition has a payoff of 0.
+        N_without_i = N ^ (1 << np.arange(n))
+        return (v[N] - v[N_without_i]).astype(float)
 
     def _get_core_bounds(self) -> List[Tuple]:
-        v = self.characteristic_function()
-        N = self.coalitions[-1]
-        lower_bounds = [v[coalition] for coalition in self.get_one_coalitions()]
-        upper_bounds = [v[N] - sum(lb for j, lb in enumerate(lower_bounds) if j != i) for i, _ in
-                        enumerate(lower_bounds)]
-        return [(lb, ub) for lb, ub in zip(lower_bounds, upper_bounds)]
+        lower_bounds, upper_bounds = self._get_core_bound_arrays()
+        return list(zip(lower_bounds.tolist(), upper_bounds.tolist()))
+
+    def _get_core_bound_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the lower and upper bounds of the payoffs of the individual players as arrays."""
+        v = self._get_characteristic_values()
+        N = int(self._masks[-1])
+        lower_bounds = v[1 << np.arange(len(self.players))]
+        # The upper bound of a player is the payoff of the grand coalition minus the lower bounds of all other players.
+        upper_bounds = v[N] - (lower_bounds.sum() - lower_bounds)
+        return lower_bounds, upper_bounds
 
     def is_in_imputation_set(self, x) -> bool:
         """
@@ -158,12 +399,11 @@ class Game(BaseGame):
         """
         if len(x) != len(self.players):
             raise ValueError("Input vector's length does not match the number of players in the game.")
-        N = self.coalitions[-1]
-        v = self.characteristic_function()
-        v_N = v[N]
-        v_one_coalitions = [v[c] for c in self.get_one_coalitions()]
+        v = self._get_characteristic_values()
+        v_N = v[self._masks[-1]]
+        v_one_coalitions = [v[1 << i] for i in range(len(self.players))]
         # Check if point lies within the range and for pareto efficiency.
-        return all([lb <= p for p, lb in zip(x, v_one_coalitions)]) and sum(x) == v_N
+        return all([lb <= p for p, lb in zip(x, v_one_coalitions)]) and bool(sum(x) == v_N)
 
     def is_in_core(self, x) -> bool:
         """
@@ -171,11 +411,10 @@ class Game(BaseGame):
         """
         if len(x) != len(self.players):
             raise ValueError("Input vector's length does not match the number of players in the game.")
-        N = self.coalitions[-1]
-        v_N = self.characteristic_function()[N]
+        v_N = self._get_characteristic_values()[self._masks[-1]]
         bounds = self._get_core_bounds()
         # Check if point lies within the range and for pareto efficiency.
-        return all([lb <= p <= ub for p, (lb, ub) in zip(x, bounds)]) and sum(x) == v_N
+        return all([lb <= p <= ub for p, (lb, ub) in zip(x, bounds)]) and bool(sum(x) == v_N)
 
     def get_imputation_vertices(self) -> np.ndarray:
         """
@@ -188,131 +427,131 @@ class Game(BaseGame):
         A imputation vector u is payoff vector, in which the payoffs are distributed in such a way, that the players will have a reason to join the grand coalition.
         The imputations of the game is the convex hull of the obtained imputation vertices.
         """
-        v = self.characteristic_function()
+        v = self._get_characteristic_values()
         n = len(self.players)
 
         if n == 1:
-            return np.array([[v[(1),]]])
+            return np.array([[v[1]]])
 
         # The bounds for the payoffs for the individual players.
-        bounds = self._get_core_bounds()
+        lower_bounds, upper_bounds = self._get_core_bound_arrays()
 
         # Calculate the impuation vertices, based on the indivdual payoffs and the efficiency constraint.
-        X = np.zeros((n, n))
-        for i, _ in enumerate(bounds):
-            x = [bound[1] if i == j else bound[0] for j, bound in enumerate(bounds)]
-            X[i] = x
+        # In vertex i, player i receives the upper bound, while all other players receive their lower bounds.
+        X = np.tile(lower_bounds, (n, 1)).astype(float)
+        X[np.diag_indices(n)] = upper_bounds
 
         # Remove duplicate vectors.
         X = np.unique(X, axis=0)
         return X
 
     def get_core_vertices(self) -> np.ndarray:
-        v = self.characteristic_function()
-        N = self.coalitions[-1]
+        v = self._get_characteristic_values()
+        N = int(self._masks[-1])
         n = len(self.players)
 
         # Get the coalitions in between the one coalitions and the grand coalition.
-        cols = self.coalitions[n:-1]
+        col_masks = self._masks[n:-1]
 
-        # Initialize game constraints
+        # Initialize game constraints once as contiguous float arrays, such that they are shared by all LPs below.
 
         # Equality constraints.
-        A_eq = [[1 for _ in range(n)]]
-        b_eq = [v[N]]
+        A_eq = np.ones((1, n))
+        b_eq = np.array([v[N]], dtype=float)
 
         # Upper bound constraints.
-        A_ub = [[-1 if (i + 1) in coalition else 0 for i in range(n)] for coalition in cols]
-        b_ub = [v[c] for c in cols]
+        A_ub = -self._get_membership_matrix()[n:-1].astype(float)
+        b_ub = v[col_masks].astype(float)
 
-        # Get the initial bounds for each player.
-        lbs = [v[c] for c in self.get_one_coalitions()]
-        ubs = [v[N] - sum(lb for j, lb in enumerate(lbs) if j != i) for i, _ in enumerate(lbs)]
-        bounds = [(lb, ub) for lb, ub in zip(lbs, ubs)]
+        # Get the initial lower bounds for each player.
+        lbs = v[1 << np.arange(n)]
 
         # Update bounds.
 
         # Upper bounds.
-        new_ubs = list(reversed([v[N] - b_ub[i] for i in range(n)]))
-        for i, new_ub in enumerate(new_ubs):
-            bounds[i] = (bounds[i][0], new_ub)
+        new_ubs = v[N] - b_ub[n - 1::-1]
 
         # Lower bounds.
-        new_lbs = [max(bound[0], v[N] - sum(u for j, u in enumerate(new_ubs) if j != i)) for i, bound in
-                   enumerate(bounds)]
-        for i, new_lb in enumerate(new_lbs):
-            bounds[i] = (new_lb, bounds[i][1])
+        new_lbs = np.maximum(lbs, v[N] - (new_ubs.sum() - new_ubs))
+        bounds = list(zip(new_lbs.tolist(), new_ubs.tolist()))
 
         C = self._get_maximization_coefficients(bounds)
 
-        return np.unique(
-            [np.round(linprog(c, A_eq=A_eq, b_eq=b_eq, A_ub=A_ub, b_ub=b_ub, bounds=bounds).x).astype(int) for c in C],
-            axis=0)
+        X = np.vstack([linprog(c, A_eq=A_eq, b_eq=b_eq, A_ub=A_ub, b_ub=b_ub, bounds=bounds, method="highs-ds").x
+                       for c in C])
+        return np.unique(np.round(X).astype(int), axis=0)
+
+    def _get_pairwise_characteristic_values(self) -> np.ndarray:
+        """
+        Returns the characteristic values for checks on sums of two payoffs.
+        If these sums may exceed the range of 64 bit integers, the payoffs are returned as arbitrary precision integers,
+        such that the sums do not wrap around.
+        """
+        v = self._get_characteristic_values()
+        if np.issubdtype(v.dtype, np.integer):
+            max_payoff = max(abs(int(v.max())), abs(int(v.min())))
+            if 2 * max_payoff > np.iinfo(np.int64).max:
+                return v.astype(object)
+        return v
 
     def is_convex(self) -> bool:
-        v = self.characteristic_function().copy()
-        v[tuple()] = 0
-        for i, C in enumerate(self.coalitions):
-            for D in self.coalitions[i:]:
-                C_set = set(C)
-                D_set = set(D)
-                C_union_D = C_set.union(D_set)
-                C_intersection_D = C_set.intersection(D)
-                C_union_D = tuple(sorted(p for p in C_union_D))
-                C_intersection_D = tuple(sorted(p for p in C_intersection_D))
-
-                if v[C_union_D] + v[C_intersection_D] < v[C] + v[D]:
-                    return False
+        v = self._get_pairwise_characteristic_values()
+        if _kernels.can_compile(v):
+            return _kernels.is_convex_kernel(v)
+
+        masks = self._masks
+        # Check the supermodularity v(C union D) + v(C intersection D) >= v(C) + v(D) for blocks of coalitions C
+        # against all coalitions D following them, such that every pair is checked once and a block fits into cache.
+        block_size = max(1, _MAX_BLOCK_ELEMENTS // len(masks))
+        for start in range(0, len(masks), block_size):
+            C = masks[start:start + block_size, None]
+            D = masks[None, start:]
+            if np.any(v[C | D] + v[C & D] < v[C] + v[D]):
+                return False
         return True
 
     def is_additive(self) -> bool:
-        v = self.characteristic_function().copy()
-        v[tuple()] = 0
-        for i, A, in enumerate(self.coalitions):
-            for B in self.coalitions[i:]:
-                A_set = set(A)
-                B_set = set(B)
-                A_intersection_B = A_set.intersection(B_set)
-
-                if A_intersection_B:
-                    continue
-
-                A_union_B = A_set.union(B)
-                A_union_B = tuple(sorted(p for p in A_union_B))
-                if v[A] + v[B] != v[A_union_B]:
-                    return False
+        v = self._get_pairwise_characteristic_values()
+        if _kernels.can_compile(v):
+            return _kernels.is_additive_kernel(v)
+
+        masks = self._masks
+        # Check v(A) + v(B) = v(A union B) for blocks of coalitions A against all coalitions B following them,
+        # such that every pair is checked once and a block fits into cache.
+        block_size = max(1, _MAX_BLOCK_ELEMENTS // len(masks))
+        for start in range(0, len(masks), block_size):
+            A = masks[start:start + block_size, None]
+            B = masks[None, start:]
+            # Only disjoint coalitions have to be additive.
+            is_disjoint = (A & B) == 0
+            if np.any(is_disjoint & (v[A] + v[B] != v[A | B])):
+                return False
         return True
 
     def _get_maximization_coefficients(self, bounds: List[Tuple]) -> np.ndarray:
-        v = self.characteristic_function()
-        N = self.coalitions[-1]
-        C = np.diag([-1 for _ in range(len(bounds))])
+        v = self._get_characteristic_values()
+        N = int(self._masks[-1])
+        n = len(bounds)
         C_res = []
         # Iterate over the bounds.
         for i, bound in enumerate(bounds):
             remainder = v[N] - bound[1] - sum(b[0] for j, b in enumerate(bounds) if j != i)
             # Vertex is an imputation, we can let it untouched.
             if remainder == 0:
-                C_res.append(C[i])
-                continue
+                c = np.zeros((1, n), dtype=int)
+                c[0, i] = -1
+                C_res.append(c)
             # We need to maximize all other players j != i, but one player k != i
             else:
-                # Update current player, to be definitely maximized.
-                current_max_num = C[i][i] - 1
-                c = [0 for _ in range(len(bounds))]
-                c[i] = current_max_num
-
-                # Find all other players, who should not be directly maximized.
-                other_players = [index for index, val in enumerate(c) if val == 0]
-
-                # Update all players to be maximized after player i.
-                for k in other_players:
-                    new_c = np.array(c).copy()
-                    for p in [p for p in other_players if p != k]:
-                        new_c[p] = current_max_num + 1
-                    C_res.append(np.array(new_c))
+                # Player i is maximized the most, every other player k is left out once, while the remaining players
+                # are maximized after player i.
+                other_players = [k for k in range(n) if k != i]
+                c = np.full((n - 1, n), -1)
+                c[:, i] = -2
+                c[np.arange(n - 1), other_players] = 0
+                C_res.append(c)
 
-        return np.array(C_res)
+        return np.vstack(C_res)
 
     def get_minimal_rights_vector(self) -> np.ndarray:
         """
@@ -324,22 +563,16 @@ class Game(BaseGame):
         m_i = max_{S: i in S} R(S, i) for i = 1,...,n,
         A player i can justify a minimum payoff of m_i when joining the grand coalition.
         """
-        v = self.characteristic_function()
+        v = self._get_characteristic_values()[self._masks]
         M = self.get_utopia_payoff_vector()
-        n = len(self.players)
-        R = np.zeros((n,))
-        for i, player in enumerate(self.players):
-            S_vec = [S for S in self.coalitions if player in S]
-            R_S = np.zeros((len(S_vec),))
-            for j, S in enumerate(S_vec):
-                v_S = v[S]
-                M_j_sum = np.sum(M_j for index, M_j in enumerate(M) if (index + 1) != player and (index + 1) in S)
-                R_s_i = v_S - M_j_sum
-                R_S[j] = R_s_i
-            R[i] = np.max(R_S)
-        return R
-
-    def __check_if_contributions_are_monotone(self, contributions: List[int]) -> bool:
+        membership = self._get_membership_matrix()
+        # R(S, i) = v(S) - sum_{j in S} M_j + M_i for all coalitions S and players i at once.
+        R = (v - membership @ M)[:, None] + M[None, :]
+        # Only coalitions containing player i are considered for the maximum of player i.
+        R[~membership] = -np.inf
+        return R.max(axis=0)
+
+    def __check_if_contributions_are_monotone(self, contributions: np.ndarray) -> bool:
         """
         Checks wheter the contribution vector contains montonely growing contributions.
         We define monotonley growing contributions such that any coalition with size i, has to contribute
@@ -347,28 +580,13 @@ class Game(BaseGame):
         """
 
         # TODO: Change this behaviour on a subset basis.
-        contribs_monotone = True
-        start_idx = 0
-        num_players = len(self.players)
-        max_contribs = []
-        for i in range(1, num_players + 1):
-
-            # The number of elements for a coalition size is determined by
-            # the binomial coeffiecent of the current number of players out of the whole number of players.
-            # Add start_idx to the corresponding offset.
-            end_idx = int(binom(num_players, i)) + start_idx
-            contribs = contributions[start_idx:end_idx]
-            max_contrib = max(contribs)
+        # The contributions are ordered by coalition size.
+        offsets = self._get_size_offsets()
 
-            # Check if we have already seen a larger contribution in the past, i.e. in a smaller coalition.
-            if any(contrib for contrib in max_contribs if contrib > max_contrib):
-                contribs_monotone = False
-                break
-
-            # Update the maximum list and update the start index.
-            max_contribs.append(max_contrib)
-            start_idx = end_idx
-        return contribs_monotone
+        # Check if we have already seen a larger contribution in the past, i.e. in a smaller coalition,
+        # which is the case iff the maximum contributions per coalition size are not growing monotone.
+        max_contribs = np.maximum.reduceat(contributions, offsets[:-1])
+        return bool(np.all(np.diff(max_contribs) >= 0))
 
 
 class WeightedVotingGame(BaseGame):
@@ -382,36 +600,89 @@ class WeightedVotingGame(BaseGame):
 
         num_players = len(contributions)
         self._players = [i for i in range(1, num_players + 1)]
-        self._coalitions = self._init_coalitions()
 
         # Parameter check.
-        if any(weight for weight in contributions if weight < 0):
+        # The weights are kept as passed, while all computations use them as a numpy array.
+        contributions_array = np.asarray(contributions)
+        if (contributions_array < 0).any():
             raise ValueError("Weight vector containns nonallowed negative weights.")
         if quorum < 0:
             raise ValueError("Qurom is only allowed to be greater than 0.")
 
         self._contributions = contributions
+        self._contributions_array = contributions_array
+        self._coalition_weights = None
         self.quorum = quorum
 
+    @property
+    def quorum(self) -> int:
+        """Property for quorum field."""
+        return self._quorum
+
+    @quorum.setter
+    def quorum(self, quorum: int) -> None:
+        """Sets the quorum and invalidates all cached results depending on it."""
+        self._quorum = quorum
+        self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        """Invalidates all cached results, which depend on the quorum."""
+        self._characteristic_function = None
+        self._characteristic_values = None
+        self._pivot_matrix = None
+        self._preference_matrix = None
+        self._winning_coalitions = None
+        self._minimal_winning_indices = None
+        self._shift_winning_indices = None
+        self._null_players = None
+        self._swing_counts = None
+        self._preferred_players = {}
+        self._membership_counts = {}
+
     def __repr__(self) -> str:
         repr = super().__repr__()
         repr += f"quorum = {self.quorum}"
         repr += "\n"
         max_weights_to_show = 32
         weights_to_show = min(max_weights_to_show, len(self.contributions))
-        repr += "weights = ["
-        for i in range(weights_to_show):
-            if i == weights_to_show - 1:
-                repr += f"{self.contributions[i]}"
-            else:
-                repr += f"{self.contributions[i]}, "
-        repr += "]"
+        repr += "weights = [" + ", ".join(map(str, self.contributions[:weights_to_show])) + "]"
         return repr
 
-    def characteristic_function(self) -> Dict[Tuple, int]:
+    def characteristic_function(self) -> Mapping[Tuple, int]:
         """Returns the characteristic function of this weighted voting game."""
-        return {coalition: 1 if sum(self.contributions[player - 1] for player in coalition) >= self.quorum else 0 for
-                coalition in self.coalitions}
+        # The characteristic function only depends on the weights and the quorum, so build it once and reuse it.
+        # It is returned as a read-only view, such that callers cannot modify the cached payoffs. Only the dict is
+        # cached, since views cannot be pickled.
+        if self._characteristic_function is None:
+            self._characteristic_function = dict(zip(self.coalitions, self._get_coalition_values().tolist()))
+        return MappingProxyType(self._characteristic_function)
+
+    def _get_coalition_values(self) -> np.ndarray:
+        """Returns the payoffs of all coalitions, which are 1 for winning and 0 for losing coalitions."""
+        return (self._get_coalition_weights() >= self.quorum).astype(np.int64)
+
+    def _get_coalition_weights(self) -> np.ndarray:
+        """Returns the sum of weights of every coalition, aligned with the coalitions of the game."""
+        if self._coalition_weights is None:
+            if _kernels.can_compile(self._contributions_array):
+                self._coalition_weights = _kernels.coalition_weights_kernel(self._contributions_array, self._masks)
+            else:
+                self._coalition_weights = self._get_membership_matrix() @ self._contributions_array
+        return self._coalition_weights
+
+    def _get_pivot_matrix(self) -> np.ndarray:
+        """
+        Returns a boolean matrix of shape (number of coalitions, number of players),
+        where entry (c, i) denotes whether player i + 1 is a pivot player in the c-th coalition.
+        Rows of losing coalitions contain no pivot players.
+        """
+        if self._pivot_matrix is None:
+            coalition_weights = self._get_coalition_weights()
+            is_winning = coalition_weights >= self.quorum
+            weights_without_player = coalition_weights[:, None] - self._contributions_array[None, :]
+            self._pivot_matrix = (self._get_membership_matrix() & (weights_without_player < self.quorum)
+                                  & is_winning[:, None])
+        return self._pivot_matrix
 
     def null_players(self) -> List[int]:
         """
@@ -422,43 +693,111 @@ class WeightedVotingGame(BaseGame):
             - N dentes the grand coalition.
             - P(N) denotes the powerset of all coalitions.
         """
-        v = self.characteristic_function().copy()
-        coalitions = self.coalitions.copy()
-        coalitions.insert(0, tuple())
-        v[tuple()] = 0
-        null_players = []
-
-        for i in self.players:
-            cols = [S for S in coalitions if i not in S or S is ()]
-            is_null_player = True
-            for S in cols:
-                S_set = set(S)
-                S_union_i = S_set.union({i})
-                S_union_i = tuple(sorted(p for p in S_union_i))
-                if v[S_union_i] - v[S] == 1:
-                    is_null_player = False
-                    break
-            if is_null_player:
-                null_players.append(i)
-
-        return null_players
+        if self._null_players is None:
+            # Since the game is monotone, v(S union {i}) - v(S) = 1 holds iff i is a pivot player in S union {i}.
+            # The empty coalition is always losing, such that i is also no null player if {i} is winning.
+            n = len(self.players)
+            one_coalitions_winning = self._get_characteristic_values()[1 << np.arange(n)].astype(bool)
+            is_pivot_player = (self._get_pivot_matrix().any(axis=0) | one_coalitions_winning).tolist()
+            self._null_players = [player for player, is_pivot in zip(self.players, is_pivot_player) if not is_pivot]
+        return self._null_players.copy()
 
     def winning_coalitions_without_null_players(self) -> List[Tuple]:
         """Returns a list of all winning coalitions without null players."""
-        null_players = self.null_players()
-        winning_coalitions = self.get_winning_coalitions()
-        return [col for col in winning_coalitions if not any(p for p in col if p in null_players)]
+        return self._get_coalitions_at(self._get_null_player_free_winning_indices())
+
+    def _get_null_player_free_winning_indices(self) -> np.ndarray:
+        """Returns the indices of the winning coalitions without null players within the coalitions of the game."""
+        null_players_mask = self._coalition_to_mask(self.null_players())
+        winning_indices = self._get_winning_indices()
+        return winning_indices[(self._masks[winning_indices] & null_players_mask) == 0]
 
     def get_minimal_winning_coalitions(self) -> List[Tuple]:
         """Returns a list of the minimal winning coalitions."""
-        critical_coalitions = self.get_pivot_players()
-        return [coalition for coalition, critical_players in critical_coalitions.items() if
-                coalition == tuple(critical_players)]
+        return self._get_coalitions_at(self._get_minimal_winning_indices())
+
+    def _get_minimal_winning_indices(self) -> np.ndarray:
+        """Returns the indices of the minimal winning coalitions within the coalitions of the game."""
+        if self._minimal_winning_indices is None:
+            # A winning coalition is minimal, iff every member is a pivot player.
+            pivot_matrix = self._get_pivot_matrix()
+            is_minimal = (pivot_matrix == self._get_membership_matrix()).all(axis=1) & pivot_matrix.any(axis=1)
+            self._minimal_winning_indices = np.flatnonzero(is_minimal)
+        return self._minimal_winning_indices
 
     def get_winning_coalitions(self) -> List[Tuple]:
         """Returns a list containing winning coalitions, i.e all coalitions with a sum of weights >= the quorum."""
-        return [coalition for coalition in self.coalitions if
-                sum(self.contributions[player - 1] for player in coalition) >= self.quorum]
+        if self._winning_coalitions is None:
+            self._winning_coalitions = self._get_coalitions_at(self._get_winning_indices())
+        return self._winning_coalitions.copy()
+
+    def _get_winning_indices(self) -> np.ndarray:
+        """Returns the indices of the winning coalitions within the coalitions of the game."""
+        return np.flatnonzero(self._get_coalition_weights() >= self.quorum)
+
+    def _can_count_swings(self) -> bool:
+        """
+        Returns whether the swing counts can be obtained by dynamic programming over the weights,
+        which requires integer weights and a finite quorum and is only done if it is cheaper than evaluating all coalitions.
+        """
+        n = len(self.players)
+        return (np.issubdtype(self._contributions_array.dtype, np.integer) and bool(np.isfinite(self.quorum))
+                and n * ceil(self.quorum) < (1 << n))
+
+    def _get_swing_counts(self) -> np.ndarray:
+        """
+        Returns an integer matrix of shape (number of players, number of players), where entry (j, k) denotes the
+        number of coalitions C of size k with j + 1 not in C, such that j + 1 is a pivot player in C union {j + 1},
+        i.e. q - w_{j + 1} <= w(C) < q.
+        The counts are obtained by the dynamic programming of Mann and Shapley, which needs O(n^2 * q) instead of
+        O(n * 2^n) steps for integer weights.
+        """
+        if self._swing_counts is None:
+            n = len(self.players)
+            weights = self._contributions_array.tolist()
+            # Integer weights reach the quorum iff they reach the quorum rounded up.
+            quorum = ceil(self.quorum)
+
+            # Entry (k, x) denotes the number of coalitions of size k with weight x, for all weights below the quorum.
+            counts = np.zeros((n + 1, quorum), dtype=np.int64)
+            if quorum > 0:
+                counts[0, 0] = 1
+            for w in weights:
+                if w < quorum:
+                    counts[1:, w:] += counts[:-1, :quorum - w]
+
+            self._swing_counts = np.zeros((n, n), dtype=np.int64)
+            for j, w in enumerate(weights):
+                # Remove player j + 1 again. The coalitions of size k with player j + 1 are given by the coalitions of
+                # size k - 1 without player j + 1, such that the counts without j + 1 are obtained by increasing size.
+                counts_without_j = counts[:-1].copy()
+                if w < quorum:
+                    for k in range(1, n):
+                        counts_without_j[k, w:] -= counts_without_j[k - 1, :quorum - w]
+                self._swing_counts[j] = counts_without_j[:, max(0, quorum - w):].sum(axis=1)
+        return self._swing_counts
+
+    def _get_membership_counts(self, coalitions: str) -> np.ndarray:
+        """
+        Returns for every player the number of coalitions containing the player within a set of coalitions, which is one of
+            - "winning": the winning coalitions.
+            - "minimal_winning": the minimal winning coalitions.
+            - "shift_winning": the shift minimal winning coalitions.
+            - "null_player_free_winning": the winning coalitions without null players.
+        """
+        if coalitions not in self._membership_counts:
+            get_indices = {
+                "winning": self._get_winning_indices,
+                "minimal_winning": self._get_minimal_winning_indices,
+                "shift_winning": self._get_shift_winning_indices,
+                "null_player_free_winning": self._get_null_player_free_winning_indices,
+            }[coalitions]
+            # Count the members of all coalitions at once, such that every index counting players shares a single pass.
+            membership_counts = self._get_membership_matrix()[get_indices()].sum(axis=0)
+            # The counts are shared by all indices, such that they must not be modified.
+            membership_counts.setflags(write=False)
+            self._membership_counts[coalitions] = membership_counts
+        return self._membership_counts[coalitions]
 
     def get_shift_winning_coalitions(self) -> List[Tuple]:
         """
@@ -468,21 +807,32 @@ class WeightedVotingGame(BaseGame):
             (S/{i}) union {j} not in W_m.
         A shift minimal winning coalition is therefore are minimal winning coalition, where no player can not be replaced by a less desired player.
         """
-
-        W_m = self.get_minimal_winning_coalitions()
-        shift_minimal_winning_coalitions = []
+        return self._get_coalitions_at(self._get_shift_winning_indices())
+
+    def _get_shift_winning_indices(self) -> np.ndarray:
+        """Returns the indices of the shift minimal winning coalitions within the coalitions of the game."""
+        if self._shift_winning_indices is None:
+            self._shift_winning_indices = self.__shift_winning_indices()
+        return self._shift_winning_indices
+
+    def __shift_winning_indices(self) -> np.ndarray:
+        """Evaluates the shift minimality of all minimal winning coalitions."""
+        W_m_indices = self._get_minimal_winning_indices()
+        W_m = self._get_coalitions_at(W_m_indices)
+        W_m_masks = self._masks[W_m_indices].tolist()
+        W_m_mask_set = set(W_m_masks)
+        shift_minimal_winning_indices = []
         unique_pivot_players = set(sum(W_m, ()))
-        for S in W_m:
+        for S, S_mask, S_index in zip(W_m, W_m_masks, W_m_indices.tolist()):
             is_condition_met = True
             for i in S:
                 players_not_in_S = [player for player in unique_pivot_players if
-                                    player not in S and self.preferred_player(i, player) == i]
+                                    not (S_mask >> (player - 1)) & 1 and self.preferred_player(i, player) == i]
 
                 for j in players_not_in_S:
-                    S_without_i = tuple(p for p in S if p != i)
-                    S_without_i_union_j = tuple(sorted(S_without_i + (j,)))
+                    S_without_i_union_j = (S_mask & ~(1 << (i - 1))) | (1 << (j - 1))
                     # Found a minimal winning coalition by shifting with a less desirable player --> Not shift minimal.
-                    if S_without_i_union_j in W_m:
+                    if S_without_i_union_j in W_m_mask_set:
                         is_condition_met = False
                         break
 
@@ -491,9 +841,9 @@ class WeightedVotingGame(BaseGame):
                     break
 
             if is_condition_met:
-                shift_minimal_winning_coalitions.append(S)
+                shift_minimal_winning_indices.append(S_index)
 
-        return shift_minimal_winning_coalitions
+        return np.array(shift_minimal_winning_indices, dtype=np.int64)
 
     def preferred_player(self, i: int, j: int, prefer_by_weight: bool = True) -> Optional[int]:
         """
@@ -511,26 +861,45 @@ class WeightedVotingGame(BaseGame):
         if i not in self.players or j not in self.players:
             raise ValueError("Specified players are note part of the game.")
 
-        coalitions = self.coalitions[:-1]
-        condition_one_met = True
-        condition_two_met = False
-        winning_coalitions = self.get_winning_coalitions()
+        # The preference only depends on the winning coalitions, so every pair has to be evaluated once.
+        key = (i, j, prefer_by_weight)
+        if key not in self._preferred_players:
+            self._preferred_players[key] = self.__preferred_player(i, j, prefer_by_weight)
+        return self._preferred_players[key]
+
+    def _get_preference_matrix(self) -> np.ndarray:
+        """
+        Returns a boolean matrix of shape (number of players, number of players),
+        where entry (i, j) denotes whether there is a coalition S with i + 1 not in S and j + 1 not in S, such that
+        (S union {j + 1}) in W and (S union {i + 1}) not in W.
+        """
+        if self._preference_matrix is None:
+            is_winning = self._get_characteristic_values().astype(bool)
+            masks = self._masks
+            n = len(self.players)
+            # Bit i of the c-th entry denotes whether the c-th coalition wins together with player i + 1.
+            winning_with_player = np.zeros(len(masks), dtype=np.int64)
+            for i in range(n):
+                winning_with_player |= is_winning[masks | (1 << i)].astype(np.int64) << i
+            # For every player j + 1, collect the players i + 1 in one pass over the coalitions S neither containing
+            # i + 1 nor j + 1, such that S wins together with j + 1, but loses together with i + 1.
+            players = np.arange(n)
+            self._preference_matrix = np.zeros((n, n), dtype=bool)
+            for j in range(n):
+                wins_with_j = ((masks >> j) & 1 == 0) & ((winning_with_player >> j) & 1 == 1)
+                preferred_bits = np.bitwise_or.reduce(~winning_with_player[wins_with_j] & ~masks[wins_with_j])
+                self._preference_matrix[:, j] = (preferred_bits >> players) & 1
+        return self._preference_matrix
+
+    def __preferred_player(self, i: int, j: int, prefer_by_weight: bool) -> Optional[int]:
+        """Evaluates the preference conditions of preferred_player for the players i and j."""
+        preference_matrix = self._get_preference_matrix()
 
         # Condition 1:
-        S = [s for s in coalitions if i not in s and j not in s]
-        for s in S:
-            s_union_j = tuple(sorted(s + (j,)))
-            s_union_i = tuple(sorted(s + (i,)))
-            if s_union_j in winning_coalitions and s_union_i not in winning_coalitions:
-                condition_one_met = False
-                break
+        condition_one_met = not preference_matrix[i - 1, j - 1]
 
         # Condition 2:
-        for t in S:
-            t_union_j = tuple(sorted(t + (j,)))
-            t_union_i = tuple(sorted(t + (i,)))
-            if t_union_j not in winning_coalitions and t_union_i in winning_coalitions:
-                condition_two_met = True
+        condition_two_met = bool(preference_matrix[j - 1, i - 1])
 
         # Both conditions satisfied.
         if condition_one_met and condition_two_met:
@@ -540,9 +909,9 @@ class WeightedVotingGame(BaseGame):
         # Since every winning coalition with j is also a winning with i, but there is no coalition,
         # such that this coalition is winning with i but not with j, we can use the weight to indicate a more sensitive preferation.
         if prefer_by_weight and condition_one_met and not condition_two_met:
-            if self.contributions[i - 1] > self.contributions[j - 1]:
+            if self._contributions_array[i - 1] > self._contributions_array[j - 1]:
                 return i
-            elif self.contributions[j - 1] > self.contributions[i - 1]:
+            elif self._contributions_array[j - 1] > self._contributions_array[i - 1]:
                 return j
             return None
 
@@ -562,17 +931,13 @@ class WeightedVotingGame(BaseGame):
         Returns a list with all critical players with respect to every winning coalition.
         A player p is considered as pivot player in a winning coalition C if C becomes a losing coalition if p leaves C.
         """
-        winning_coalitions = self.get_winning_coalitions()
+        pivot_matrix = self._get_pivot_matrix()
 
         if all_coalitions:
-            return {coalition:
-                        [player for player in coalition if (
-                                    sum(self.contributions[winning_player - 1] for winning_player in coalition) -
-                                    self.contributions[player - 1]) < self.quorum and coalition in winning_coalitions]
-                    for coalition in self.coalitions}
+            indices = range(len(self.coalitions))
         else:
-            return {winning_coalition:
-                        [player for player in winning_coalition if (
-                                    sum(self.contributions[winning_player - 1] for winning_player in winning_coalition) -
-                                    self.contributions[player - 1]) < self.quorum]
-                    for winning_coalition in winning_coalitions}
+            indices = self._get_winning_indices().tolist()
+
+        pivot_rows = pivot_matrix[indices].tolist()
+        return {coalition: [player for player, is_pivot in zip(self.players, row) if is_pivot]
+                for coalition, row in zip(self._get_coalitions_at(indices), pivot_rows)}
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import math
-from typing import List, Tuple
+from typing import Optional
 from cooperative_games.games import WeightedVotingGame
 import numpy as np
 
@@ -27,29 +27,50 @@ class ShapleyShubikIndex(PowerIndex):
         """
         n = len(game.players)
         factorial_n = math.factorial(n)
-        v = game.characteristic_function()
-        shapley_shubik_indices = np.zeros((n,))
 
         # Consider edge case with only 1 player. 
         # In that case, there exists no other coalition than the coalition consisting of that one player.
         # The loop would not be triggered, such that the return value would be 0 in every execution.
         # Because of this, return just the value of the characteristic function, since it also represents the shapley-shubik-index in this case. 
         if n == 1:
-            return np.array([v[(1,)]])
-
-        for i, player in enumerate(game.players):
-            shapley_shubik_index = 0
-            coalitions_without_player = [coalition for coalition in game.coalitions if player not in coalition]
-            for C in coalitions_without_player:
-                C_len = len(C)
-                C_len_factorial = math.factorial(C_len)
-                complement_factorial = math.factorial(n - C_len - 1)
-                # Create a sorted tuple out of the union with the current player, since the key tuples of the characterstic function are sensitive to order.
-                pivot_term = v[tuple(sorted(C + (player,)))] - v[C]
-                shapley_shubik_index += C_len_factorial * complement_factorial * pivot_term
-            shapley_shubik_indices[i] = shapley_shubik_index / factorial_n
+            return np.array([game._get_characteristic_values()[1]])
+
+        # The weight |C|! * (n - |C| - 1)! of a coalition only depends on its size.
+        size_weights = game._get_shapley_weights()
+        if game._can_count_swings():
+            # The marginal contribution of a player is 1 iff it is a pivot player, where the empty coalition is not considered.
+            marginal_contribution_sums = game._get_swing_counts()[:, 1:] @ size_weights[1:]
+        else:
+            marginal_contribution_sums = game._get_marginal_contribution_sums(size_weights)
+        shapley_shubik_indices = (marginal_contribution_sums / factorial_n).astype(float)
         return shapley_shubik_indices
 
+    def compute_approx(self, game: WeightedVotingGame, n_samples: int = 10000,
+                       seed: Optional[int] = None) -> np.ndarray:
+        """
+        Returns an estimate of the shapley-shubik-indices for all players in the game, sampled from random permutations.
+        The shapley-shubik-index of a player j equals the probability, that j is the pivot player in a random permutation
+        of the players, i.e. the first player, whose joining turns the preceding players into a winning coalition.
+        Only the weights of the players are evaluated, such that the estimate needs O(n_samples * n) instead of O(n * 2^n) steps.
+        """
+        if n_samples <= 0:
+            raise ValueError("Number of samples has to be greater than 0.")
+
+        n = len(game.players)
+        if n == 1:
+            return np.array([int(game._contributions_array[0] >= game.quorum)])
+
+        rng = np.random.default_rng(seed)
+        permutations = rng.permuted(np.tile(np.arange(n), (n_samples, 1)), axis=1)
+        is_winning = np.cumsum(game._contributions_array[permutations], axis=1) >= game.quorum
+        pivot_positions = np.argmax(is_winning, axis=1)
+
+        # Permutations without any winning coalition have no pivot player.
+        # Like in compute, the empty coalition is not considered, such that the first player of a permutation is never counted.
+        has_pivot_player = is_winning[:, -1] & (pivot_positions > 0)
+        pivot_players = permutations[has_pivot_player, pivot_positions[has_pivot_player]]
+        return np.bincount(pivot_players, minlength=n) / n_samples
+
 
 class BanzhafIndex(PowerIndex):
     def __repr__(self) -> str:
@@ -64,26 +85,57 @@ class BanzhafIndex(PowerIndex):
             - n denotes the number of players in the game.
             - v denotes the characteristic function of the game.
         """
-        v = game.characteristic_function()
         n = len(game.players)
-        banzhaf_indices = np.zeros((n,))
 
         # Consider edge case with only 1 player. 
         # In that case, there exists no other coalition than the coalition consisting of that one player.
         # The loop would not be triggered, such that the return value would be 0 in every execution.
         # Because of this, return just the value of the characteristic function, since it also represents the shapley-shubik-index in this case. 
         if len(game.players) == 1:
-            return np.array([v[(1,)]])
-
-        for i, player in enumerate(game.players):
-            coalitions_without_player = [coalition for coalition in game.coalitions if player not in coalition]
-            banzhaf_index = sum(v[tuple(sorted(C + (player,)))] - v[C] for C in coalitions_without_player)
-            banzhaf_indices[i] = banzhaf_index
+            return np.array([game._get_characteristic_values()[1]])
+
+        if game._can_count_swings():
+            # Like the enumeration, the empty coalition is not considered, such that a player does not count as pivot
+            # player in its winning one coalition.
+            banzhaf_indices = game._get_swing_counts()[:, 1:].sum(axis=1).astype(float)
+        else:
+            W_m = game._masks[game._get_minimal_winning_indices()]
+            if 0 < len(W_m) <= n:
+                # With only a few minimal winning coalitions, inclusion-exclusion over them is cheaper than enumerating
+                # all coalitions. Like the enumeration, the empty coalition is not considered, such that a player does
+                # not count as pivot player in its winning one coalition.
+                one_coalitions_winning = game._get_characteristic_values()[1 << np.arange(n)]
+                banzhaf_indices = (self.__banzhaf_scores(W_m, n) - one_coalitions_winning).astype(float)
+            else:
+                # Every coalition without the player is weighted equally.
+                banzhaf_indices = game._get_marginal_contribution_sums(np.ones((n,), dtype=np.int64)).astype(float)
         banzhaf_index_sum = np.sum(banzhaf_indices)
 
-        relative_banzhaf_indices = np.array([raw_banzhaf / banzhaf_index_sum for raw_banzhaf in banzhaf_indices])
+        relative_banzhaf_indices = banzhaf_indices / banzhaf_index_sum
         return relative_banzhaf_indices
 
+    def __banzhaf_scores(self, W_m: np.ndarray, n: int) -> np.ndarray:
+        """
+        Returns the banzhaf scores, i.e. the number of coalitions, in which a player is a pivot player, for all players.
+        The banzhaf score of a player j is given by inclusion-exclusion over the minimal winning coalitions W^m as:
+        sum_{T subseteq W^m, T not empty, j in U(T)} (-1)^{|T| - 1} 2^{n - |U(T)|}, where
+            - U(T) denotes the union of the coalitions in T.
+            - n denotes the number of players in the game.
+        """
+        # Unions and signs of all subsets of the minimal winning coalitions, built by doubling for every coalition.
+        unions = np.zeros((1,), dtype=np.int64)
+        signs = np.full((1,), -1, dtype=np.int64)
+        for W in W_m:
+            unions = np.concatenate((unions, unions | W))
+            signs = np.concatenate((signs, -signs))
+        # Skip the empty subset.
+        unions = unions[1:]
+        signs = signs[1:]
+
+        in_union = WeightedVotingGame._masks_to_membership(unions, n)
+        terms = signs * (1 << (n - in_union.sum(axis=1)))
+        return in_union.T @ terms
+
 
 class ShiftIndex(PowerIndex):
     def __repr__(self) -> str:
@@ -96,12 +148,7 @@ class ShiftIndex(PowerIndex):
         |W^sm_j| / sum^n_k=1 |W^sm_k|, where 
             - W^sm_j denotes the set of shift minimal coalitions, where player j is a member.
         """
-        W_sm = game.get_shift_winning_coalitions()
-        n = len(game.players)
-        W_sm_lens = np.zeros((n,))
-        for i, player in enumerate(game.players):
-            W_sm_j = [W for W in W_sm if player in W]
-            W_sm_lens[i] = len(W_sm_j)
+        W_sm_lens = game._get_membership_counts("shift_winning").astype(float)
 
         W_sm_len_sum = np.sum(W_sm_lens)
         return np.array([W_len / W_sm_len_sum for W_len in W_sm_lens])
@@ -118,13 +165,8 @@ class PublicGoodIndex(PowerIndex):
         |W^m_j| / sum^{n}_{k=1} |W^m_k|, where
             - W^m_j denotes all minimal winning coalitions j belongs to.
         """
-        W_m = game.get_minimal_winning_coalitions()
-        W_m_len = len(W_m)
-        n = len(game.players)
-        pgi_list = np.zeros((n,))
-        for i, player in enumerate(game.players):
-            W_m_j = [coalition for coalition in W_m if player in coalition]
-            pgi_list[i] = len(W_m_j) / W_m_len
+        W_m_len = len(game._get_minimal_winning_indices())
+        pgi_list = np.array([W_m_j_len / W_m_len for W_m_j_len in game._get_membership_counts("minimal_winning").tolist()])
 
         pgi_sum = np.sum(pgi_list)
         return np.array([pgi / pgi_sum for pgi in pgi_list])
@@ -141,13 +183,8 @@ class PublicHelpIndex(PowerIndex):
         |W_j| / sum^{n}_{k=1} |W_k|, where
             - W_j denotes all winning coalitions j belongs to.
         """
-        W = game.get_winning_coalitions()
-        W_len = len(W)
-        n = len(game.players)
-        phi_list = np.zeros((n,))
-        for i, player in enumerate(game.players):
-            W_j = [coalition for coalition in W if player in coalition]
-            phi_list[i] = len(W_j) / W_len
+        W_len = len(game._get_winning_indices())
+        phi_list = np.array([W_j_len / W_len for W_j_len in game._get_membership_counts("winning").tolist()])
 
         phi_sum = np.sum(phi_list)
         return np.array([phi / phi_sum for phi in phi_list])
@@ -165,19 +202,13 @@ class JohnstonIndex(PowerIndex):
             - VC denotes the critical coalitions, i.e. the coalitions with at least one pivot player.
             - r_j(S) denotes the reciprocal of the number of pivot players in S, if j is a pivot player, 0 else.
         """
-        VC = game.get_pivot_players()
-        n = len(game.players)
-        johnston_indices = np.zeros((n,))
-        for i, player in enumerate(game.players):
-            johnston_raw = 0
-            for S, critical_players in VC.items():
-                num_critical_players = len(critical_players)
-                if num_critical_players == 0:
-                    continue
-                r_S = 1 / num_critical_players
-                r_j_s = r_S if player in critical_players else 0
-                johnston_raw += r_j_s
-            johnston_indices[i] = johnston_raw
+        # The pivot players of the winning coalitions, restricted to the critical coalitions.
+        VC = game._get_pivot_matrix()[game._get_winning_indices()]
+        num_critical_players = VC.sum(axis=1)
+        VC = VC[num_critical_players > 0]
+        r_S = 1 / num_critical_players[num_critical_players > 0]
+        # Summing along the coalitions adds up r_S for every player in the order of the coalitions.
+        johnston_indices = np.where(VC, r_S[:, None], 0.0).sum(axis=0)
 
         johnston_sum = np.sum(johnston_indices)
         return np.array([raw_johnston / johnston_sum for raw_johnston in johnston_indices])
@@ -196,7 +227,7 @@ class EgalitarianIndex(PowerIndex):
             - n denotes the number of players in the game.
         """
         n = len(game.players)
-        winning = len(game.get_winning_coalitions()) > 0
+        winning = len(game._get_winning_indices()) > 0
         return np.full((n,), 1 / n) if winning else np.zeros((n,))
 
 
@@ -213,16 +244,12 @@ class GnMinusIndex(PowerIndex):
             - W^{n-}_i denotes the set of null player free coalitions containing player i.
             - N denotes the grand coalition.
         """
-        null_player_free_cols = game.winning_coalitions_without_null_players()
         n = len(game.players)
-        G = np.zeros((n,))
-        col_lens_without_null_player = [len([col for col in null_player_free_cols if p in col]) for p in game.players]
-        sum_lens_cols_without_null = sum(l_c for l_c in col_lens_without_null_player)
+        col_lens_without_null_player = game._get_membership_counts("null_player_free_winning")
+        sum_lens_cols_without_null = int(np.sum(col_lens_without_null_player))
         if sum_lens_cols_without_null == 0:
             return np.zeros((n,))
-        for i, player in enumerate(game.players):
-            cols_with_player_len = len([col for col in null_player_free_cols if player in col])
-            G[i] = cols_with_player_len / sum_lens_cols_without_null
+        G = col_lens_without_null_player / sum_lens_cols_without_null
         return G
 
 
@@ -241,12 +268,8 @@ class NevisonIndex(PowerIndex):
         A normalized version of this index is equal to the public help index.
         """
         n = len(game.players)
-        W = game.get_winning_coalitions()
-        NI = np.zeros((n,))
         denominator = 2 ** (n - 1)
-        for i, player in enumerate(game.players):
-            W_i_len = len([c for c in W if player in c])
-            NI[i] = W_i_len / denominator
+        NI = game._get_membership_counts("winning") / denominator
         return NI
 
 
@@ -264,15 +287,11 @@ class KoenigAndBraeuningerIndex(PowerIndex):
             - W denotes the set of winning coalitions.
         A normalized version of this index is equal to the public help index.
         """
-        W = game.get_winning_coalitions()
-        W_len = len(W)
+        W_len = len(game._get_winning_indices())
         n = len(game.players)
         if W_len == 0:
             return np.zeros((n,))
-        KB = np.zeros((n,))
-        for i, player in enumerate(game.players):
-            W_i_len = len([c for c in W if player in c])
-            KB[i] = W_i_len / W_len
+        KB = game._get_membership_counts("winning") / W_len
         return KB
 
 
@@ -290,15 +309,11 @@ class RaeIndex(PowerIndex):
             - W_i denotes the set of winning coalitions containg player i.
             - W denotes the set of winning coalitions.
         """
-        W = game.get_winning_coalitions()
-        W_len = len(W)
+        W_len = len(game._get_winning_indices())
         n = len(game.players)
         denominator = 2 ** n
-        R = np.zeros((n,))
-        for i, player in enumerate(game.players):
-            W_i_len = len([col for col in W if player in col])
-            term = (2 * W_i_len - W_len) / denominator
-            R[i] = (1 / 2) + term
+        W_i_lens = game._get_membership_counts("winning")
+        R = (1 / 2) + (2 * W_i_lens - W_len) / denominator
         if normalized:
             R_sum = np.sum(R)
             R = np.array([r / R_sum for r in R])
@@ -322,30 +337,13 @@ class SolidarityValue(PowerIndex):
         """
         n = len(game.players)
         denominator = math.factorial(n)
-        S = np.zeros((n,))
-        for i, player in enumerate(game.players):
-            coalitions_with_player = [col for col in game.coalitions if player in col]
-            t = 0
-            for col in coalitions_with_player:
-                T_len = len(col)
-                numerator = math.factorial(n - T_len) * math.factorial(T_len - 1)
-                term = numerator / denominator
-                A = self._A(game=game, T=col)
-                t += term * A
-            S[i] = t
+        # The weight (n - |T|)! * (|T| - 1)! of a coalition T equals the shapley weight of the size |T| - 1.
+        size_weights = np.concatenate(([0], game._get_shapley_weights() / denominator)).astype(float)
+        weighted_A = size_weights[game._sizes] * game._get_average_marginal_contributions()
+        # Sum over the coalitions with the player.
+        S = game._get_membership_matrix().T @ weighted_A
         return S
 
-    def _A(self, game: WeightedVotingGame, T: Tuple) -> float:
-        """Returns the average marginal contribution of a member of coalition T."""
-        v = game.characteristic_function().copy()
-        v[tuple()] = 0
-        T_len = len(T)
-        A = 0
-        for j in T:
-            T_without_j = tuple(sorted(p for p in T if p != j))
-            A += v[T] - v[T_without_j]
-        return A / T_len
-
 
 class HollerIndex(PowerIndex):
     def __repr__(self) -> str:
@@ -359,9 +357,9 @@ class HollerIndex(PowerIndex):
             - v denotes the characteristic function of the game.
             - W^m_i denotes the set of minmal winning coalitions containing player i.
         """
-        W_min = game.get_minimal_winning_coalitions()
         n = len(game.players)
-        H = np.array([len([w for w in W_min if i in w]) for i in game.players])
+        # Copy the shared counts, such that the returned indices are owned by the caller.
+        H = game._get_membership_counts("minimal_winning").copy()
         if normalized:
             H_sum = np.sum(H)
             H = np.array([h / H_sum for h in H] if H_sum > 0 else np.zeros((n,)))
@@ -380,13 +378,17 @@ class DeeganPackelIndex(PowerIndex):
             - v denotes the characteristic function of the game.
             - W^m_i denotes the set of minmal winning coalitions containing player i.
         """
-        W_min = game.get_minimal_winning_coalitions()
+        W_min_indices = game._get_minimal_winning_indices()
         n = len(game.players)
-        S = np.array([sum((1 / len(S)) if len(S) > 0 else 0 for S in W_min if i in S) for i in game.players])
+        # Minimal winning coalitions are never empty, such that the reciprocal of their size is always defined.
+        W_min_reciprocal_sizes = 1 / game._sizes[W_min_indices]
+        W_min_membership = game._get_membership_matrix()[W_min_indices]
+        # Summing along the coalitions adds up the reciprocal sizes for every player in the order of the coalitions.
+        S = np.where(W_min_membership, W_min_reciprocal_sizes[:, None], 0.0).sum(axis=0)
         if normalized:
-            W_min_len = len(W_min)
+            W_min_len = len(W_min_indices)
             if W_min_len == 0:
                 return np.zeros((n,))
             normalization_term = 1 / W_min_len
-            S = np.array([normalization_term * s for s in S])
+            S = normalization_term * S
         return S
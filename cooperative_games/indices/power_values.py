@@ -25,21 +25,11 @@ class ShapleyValue(PowerValue):
         """
         n = len(game.players)
         factorial_n = math.factorial(n)
-        v = game.characteristic_function()
-        shapley_values = np.zeros((n,))
-
-        for i, player in enumerate(game.players):
-            # Initiate with marginal contribution for player's one coalition, multiplied by the complement factorial 
-            # (always n-1, since the lenght of the empty coalition is 0).
-            shapley_value = v[(player,)] * math.factorial(n - 1)
-            coalitions_without_player = [coalition for coalition in game.coalitions if player not in coalition]
-            for C in coalitions_without_player:
-                C_len = len(C)
-                C_len_factorial = math.factorial(C_len)
-                complement_factorial = math.factorial(n - C_len - 1)
-                pivot_term = v[tuple(sorted(C + (player,)))] - v[C]
-                shapley_value += C_len_factorial * complement_factorial * pivot_term
-            shapley_values[i] = shapley_value / factorial_n
+        # The weight |C|! * (n - |C| - 1)! of a coalition only depends on its size, where the empty coalition has
+        # the weight (n - 1)!.
+        size_weights = game._get_shapley_weights()
+        marginal_contribution_sums = game._get_marginal_contribution_sums(size_weights, include_empty_coalition=True)
+        shapley_values = (marginal_contribution_sums / factorial_n).astype(float)
         return shapley_values
 
 
@@ -66,20 +56,16 @@ class BanzhafValue(PowerValue):
 
     def __K(self, game: Game) -> float:
         """Returns the coeffient for the absolute banzhaf value."""
-        N = game.coalitions[-1]
-        v = game.characteristic_function()
+        v = game._get_characteristic_values()
+        N = (1 << len(game.players)) - 1
         marg_sums = self.__marginal_contributions_sum(game)
         return v[N] / sum(marg_sums)
 
     def __marginal_contributions_sum(self, game: Game) -> np.ndarray:
         """Returns a list of the sum of marginal contributions for each player in the game."""
-        v = game.characteristic_function()
         n = len(game.players)
-        marg_sums = np.zeros((n,))
-        for i, player in enumerate(game.players):
-            coalitions_without_player = [coalition for coalition in game.coalitions if player not in coalition]
-            marg_sum = v[(player,)] + sum(v[tuple(sorted(C + (player,)))] - v[C] for C in coalitions_without_player)
-            marg_sums[i] = marg_sum
+        # Every coalition is weighted equally, including the empty coalition of the player's one coalition.
+        marg_sums = game._get_marginal_contribution_sums(np.ones((n,), dtype=np.int64), include_empty_coalition=True)
         return marg_sums
 
 
@@ -99,24 +85,22 @@ class GatelyPoint(PowerValue):
         The Gately-point can be interpretated as the intersection of the imputationn set with the line constructed by
         the payoffs of the one-coalitions and the utopia-payoff-vector.
         """
-        v = game.characteristic_function()
-        N = game.coalitions[-1]
-        M = game.get_utopia_payoff_vector()
+        v = game._get_characteristic_values()
         n = len(game.players)
+        # The grand coalition contains every player, and the one coalition of player i is given by bit i - 1.
+        N = (1 << n) - 1
+        one_coalitions = 1 << np.arange(n)
+        M = game.get_utopia_payoff_vector()
 
         if len(game.players) == 1:
-            return np.array([v[(game.players[0],)]])
-
-        X = np.zeros((n,))
-        for i, player in enumerate(game.players):
-            v_i = v[(player,)]
-            M_i = M[player - 1]
-            sum_v_j = sum(v[j] for j in game.get_one_coalitions())
-            N_one_coalitions_diff = v[N] - sum_v_j
-            player_loss = M_i - v_i
-            common_loss = sum(M) - sum_v_j
-            x_i = v_i + N_one_coalitions_diff * (player_loss / common_loss)
-            X[i] = x_i
+            return np.array([v[1]])
+
+        v_i = v[one_coalitions]
+        sum_v_j = sum(v_i.tolist())
+        N_one_coalitions_diff = v[N] - sum_v_j
+        player_loss = M - v_i
+        common_loss = sum(M) - sum_v_j
+        X = v_i + N_one_coalitions_diff * (player_loss / common_loss)
         return X
 
 
@@ -137,19 +121,19 @@ class TauValue(PowerValue):
         The tau-value can be interpretated as the intersection of the imputationn set with the line constructed by
         the minimal-rights-vector and the utopia-payoff-vector.
         """
-        v = game.characteristic_function()
+        v = game._get_characteristic_values()
         n = len(game.players)
 
         # Edge case 1 player.
         if n == 1:
-            return np.array([v[(game.players[0],)]])
+            return np.array([v[1]])
 
-        N = game.coalitions[-1]
-        m = game.get_minimal_rights_vector()
-        M = game.get_utopia_payoff_vector()
+        N = (1 << n) - 1
+        m = np.asarray(game.get_minimal_rights_vector())
+        M = np.asarray(game.get_utopia_payoff_vector())
 
-        sum_m = sum(m)
-        sum_M = sum(M)
+        sum_m = np.sum(m)
+        sum_M = np.sum(M)
         M_diff = sum_m - sum_M
         constant_diff = v[N] - sum_M
 
@@ -161,12 +145,13 @@ class TauValue(PowerValue):
             M_diff = sum_m
             constant_diff = v[N]
 
-        # Solve linear equation, to find alpha
-        coeffs = np.array([[M_diff]])
-        constant = np.array([constant_diff])
-        alpha = np.linalg.solve(coeffs, constant)[0]
+        # Solve the linear equation M_diff * alpha = constant_diff, to find alpha.
+        # The equation only has one unknown, such that it is solved by a division.
+        if M_diff == 0:
+            raise np.linalg.LinAlgError("Singular matrix")
+        alpha = constant_diff / M_diff
 
         # Compute and return tau vector.
-        return np.array([m_i + alpha * (M_i - m_i) for m_i, M_i in zip(m, M)])
+        return m + alpha * (M - m)
 
 
@@ -8,5 +8,8 @@ setup(
     license='',
     author='Edgar Wolf',
     author_email='edgar9.wolf.8@gmail.com',
-    description='A python package containing metrics and functionality for cooperative games in context of game theory.'
+    description='A python package containing metrics and functionality for cooperative games in context of game theory.',
+    extras_require={
+        'numba': ['numba'],
+    },
 )
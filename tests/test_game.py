@@ -1,5 +1,9 @@
+import copy
+import pickle
+from math import comb
 import numpy as np
 import pytest
+from cooperative_games import _kernels
 from cooperative_games.games import Game
 from cooperative_games.indices.power_values import (
     ShapleyValue,
@@ -50,6 +54,48 @@ def test_constructor():
     assert set(game.contributions) == set(contributions)
     assert set(game.coalitions) == set([(1,)])
 
+    # Test contributions beyond the range of 64 bit integers:
+    contributions = [2 ** 70, 2 ** 70, 3 * 2 ** 70]
+    game = Game(contributions=contributions)
+    assert set(game.players) == set([1, 2])
+    assert game.is_convex()
+    assert not game.is_additive()
+    with pytest.raises(ValueError, match="Contributions have to grow monotone by coalition size."):
+        contributions = [2 ** 70, 2 ** 71, 2 ** 70]
+        game = Game(contributions=contributions)
+
+    # Test contributions within the range of 64 bit integers, whose pairwise sums exceed it:
+    contributions = [5 * 10 ** 18, 5 * 10 ** 18, 9 * 10 ** 18]
+    game = Game(contributions=contributions)
+    assert not game.is_convex()
+    assert not game.is_additive()
+    contributions = [4 * 10 ** 18, 5 * 10 ** 18, 9 * 10 ** 18]
+    game = Game(contributions=contributions)
+    assert game.is_convex()
+    assert game.is_additive()
+
+
+def test_from_contributions():
+    """Test that games are shared between constructions with equal contributions."""
+    contributions = [1, 2, 3, 3, 4, 5, 6]
+    game = Game.from_contributions(contributions)
+    assert game is Game.from_contributions(list(contributions))
+    assert game.characteristic_function() == Game(contributions=contributions).characteristic_function()
+
+    contributions = [1, 2, 3, 3, 4, 5, 7]
+    assert game is not Game.from_contributions(contributions)
+
+    # Equal contributions of different types are not shared.
+    contributions = [1.0, 2, 3, 3, 4, 5, 6.0]
+    other_game = Game.from_contributions(contributions)
+    assert game is not other_game
+    assert other_game.contributions == contributions
+    assert [type(contribution) for contribution in other_game.contributions] == [float, int, int, int, int, int, float]
+
+    # Invalid contributions are still rejected.
+    with pytest.raises(ValueError, match="Contributions have to grow monotone by coalition size."):
+        Game.from_contributions([1, 2, 3, 2, 4, 5, 3])
+
 
 def test_repr():
     contributions = [1, 2, 3, 3, 4, 5, 6]
@@ -90,6 +136,17 @@ def test_characterisitc_function():
     assert actual_output == expected_output
 
 
+def test_pickle():
+    """Test that a game can be pickled and copied after its characteristic function has been cached."""
+    contributions = [1, 2, 3, 3, 4, 5, 6]
+    game = Game(contributions=contributions)
+    expected_output = game.characteristic_function()
+    for copied_game in (pickle.loads(pickle.dumps(game)), copy.deepcopy(game)):
+        assert copied_game.characteristic_function() == expected_output
+        assert copied_game.contributions == contributions
+        assert copied_game.is_convex()
+
+
 def test_get_marginal_contribution():
     """Test the marginal contribution of a player in a coaltion."""
     contributions = [1, 2, 3, 3, 5, 5, 8]
@@ -406,6 +463,19 @@ def test_shapley_value():
     actual_output = shapley.compute(game)
     assert np.array_equal(expected_output, actual_output)
 
+    # Large payoffs, whose weighted sums exceed the range of 64 bit integers, where every player contributes equally.
+    contributions = [k * 10 ** 6 for k in range(1, 17) for _ in range(comb(16, k))]
+    game = Game(contributions=contributions)
+    expected_output = np.full((16,), 10 ** 6)
+    actual_output = shapley.compute(game)
+    assert np.array_equal(expected_output, actual_output)
+
+    contributions = [k * 10 ** 11 for k in range(1, 13) for _ in range(comb(12, k))]
+    game = Game(contributions=contributions)
+    expected_output = np.full((12,), 10 ** 11)
+    actual_output = shapley.compute(game)
+    assert np.array_equal(expected_output, actual_output)
+
 
 def test_banzhaf_value():
     banzhaf = BanzhafValue()
@@ -444,6 +514,16 @@ def test_banzhaf_value():
     actual_output = banzhaf.compute(game)
     assert expected_output == actual_output
 
+    # Large payoffs, whose sums exceed the range of 64 bit integers, where every player contributes equally.
+    contributions = [k * 10 ** 16 for k in range(1, 13) for _ in range(comb(12, k))]
+    game = Game(contributions=contributions)
+    expected_output = np.full((12,), 10 ** 16)
+    actual_output = banzhaf.compute(game, normalized=False)
+    assert np.array_equal(expected_output, actual_output)
+
+    actual_output = banzhaf.compute(game)
+    assert np.allclose(expected_output, actual_output)
+
 
 def test_gately_point():
     gately = GatelyPoint()
@@ -505,3 +585,30 @@ def test_tau_value():
     expected_output = np.array([1])
     actual_output = tau.compute(game)
     assert np.array_equal(expected_output, actual_output)
+
+
+def test_numpy_fallback(monkeypatch):
+    """Test that the numpy implementations agree with the compiled kernels, which are used if numba is installed."""
+    contributions_list = [
+        [0, 0, 0, 1, 1, 1, 5],
+        [0, 0, 0, 1, 2, 1, 4],
+        [1, 2, 3, 4, 5, 6, 7],
+        [1, 1, 1, 2, 2, 2, 3],
+        [0, 0, 0, 40, 50, 20, 100],
+    ]
+
+    def evaluate(contributions):
+        game = Game(contributions=contributions)
+        return [game.is_convex(), game.is_additive()], [ShapleyValue().compute(game), BanzhafValue().compute(game)]
+
+    expected_outputs = [evaluate(contributions) for contributions in contributions_list]
+    monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+    actual_outputs = [evaluate(contributions) for contributions in contributions_list]
+    for (expected_output, expected_values), (actual_output, actual_values) in zip(expected_outputs, actual_outputs):
+        assert expected_output == actual_output
+        for expected_value, actual_value in zip(expected_values, actual_values):
+            assert np.array_equal(expected_value, actual_value)
+
+    # Invalid contributions are also rejected without the kernels.
+    with pytest.raises(ValueError, match="Contributions have to grow monotone by coalition size."):
+        Game(contributions=[1, 2, 3, 2, 4, 5, 3])
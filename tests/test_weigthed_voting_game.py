@@ -1,5 +1,8 @@
+import copy
+import pickle
 import pytest
 import numpy as np
+from cooperative_games import _kernels
 from cooperative_games.games import WeightedVotingGame
 from cooperative_games.indices.power_indices import (
     ShapleyShubikIndex,
@@ -75,6 +78,19 @@ def test_repr():
     actual_output = game.__repr__()
     assert expected_output == actual_output
 
+    # The weights are shown and returned as passed, without being converted to a common type.
+    weights = [1.5, 2, 3]
+    quorum = 4
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    expected_output = "3 players game"
+    expected_output += "\n"
+    expected_output += "quorum = 4"
+    expected_output += "\n"
+    expected_output += "weights = [1.5, 2, 3]"
+    actual_output = game.__repr__()
+    assert expected_output == actual_output
+    assert game.contributions == weights
+
 def test_characteristic_function():
     """Test the characteristic function of a weighted voting game."""
     weights = [1, 2, 3, ]
@@ -122,6 +138,53 @@ def test_characteristic_function():
     assert excpected_output == actual_output
 
 
+def test_characteristic_function_cache():
+    """Test that the cached characteristic function is rebuilt when the quorum changes."""
+    weights = [1, 2, 3, ]
+    quorum = 4
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    assert game.characteristic_function() == game.characteristic_function()
+    # The cached characteristic function is read-only.
+    with pytest.raises(TypeError):
+        game.characteristic_function()[(1,)] = 1
+    assert game.get_minimal_winning_coalitions() == [(1, 3,), (2, 3,)]
+    assert game.get_shift_winning_coalitions() == [(1, 3,)]
+
+    game.quorum = 6
+    excpected_output = {
+        (1,): 0, (2,): 0, (3,): 0,
+        (1, 2,): 0, (1, 3,): 0, (2, 3,): 0,
+        (1, 2, 3,): 1
+    }
+    actual_output = game.characteristic_function()
+    assert excpected_output == actual_output
+
+    # Cached coalitions and player results have to be rebuilt as well.
+    assert game.get_winning_coalitions() == [(1, 2, 3,)]
+    assert game.null_players() == []
+    assert game.preferred_player(1, 2) == 2
+    assert game.get_minimal_winning_coalitions() == [(1, 2, 3,)]
+    assert game.get_shift_winning_coalitions() == [(1, 2, 3,)]
+
+    game.quorum = 99
+    assert game.get_winning_coalitions() == []
+    assert game.null_players() == [1, 2, 3]
+    assert game.preferred_player(1, 2) == 2
+    assert game.get_minimal_winning_coalitions() == []
+
+
+def test_pickle():
+    """Test that a game can be pickled and copied after its characteristic function has been cached."""
+    weights = [1, 2, 3, ]
+    quorum = 4
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    expected_output = game.characteristic_function()
+    for copied_game in (pickle.loads(pickle.dumps(game)), copy.deepcopy(game)):
+        assert copied_game.characteristic_function() == expected_output
+        assert copied_game.quorum == quorum
+        assert copied_game.get_minimal_winning_coalitions() == [(1, 3,), (2, 3,)]
+
+
 def test_null_player():
     contributions = [50, 30, 20, 0]
     quorum = 51
@@ -158,6 +221,14 @@ def test_null_player():
     actual_output = game.null_players()
     assert expected_output == actual_output
 
+    # Edge case: With a quorum of 0, every player wins on its own, such that no player is a null player.
+    contributions = [1, 2]
+    quorum = 0
+    game = WeightedVotingGame(contributions=contributions, quorum=quorum)
+    expected_output = []
+    actual_output = game.null_players()
+    assert expected_output == actual_output
+
 
 def test_get_winning_coalitions():
     """Test the winning coalitions method for weighted voting games."""
@@ -190,6 +261,14 @@ def test_get_winning_coalitions():
     actual_output = game.get_winning_coalitions()
     assert excpected_output == actual_output
 
+    # Special case: Weights beyond the range of 64 bit integers.
+    weights = [2 ** 70, 1, 2]
+    quorum = 5
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    excpected_output = [(1,), (1, 2,), (1, 3,), (1, 2, 3,)]
+    actual_output = game.get_winning_coalitions()
+    assert excpected_output == actual_output
+
 
 def test_winning_coalitions_without_null_players():
     contributions = [50, 30, 20, 0]
@@ -557,6 +636,22 @@ def test_shapley_shubik_index():
     actual_output = shapley.compute(game=game)
     assert np.array_equal(expected_output, actual_output)
 
+    # Special case: Many players with small weights, counting the pivot players over the weights.
+    weights = [2, 1, 1, 1, 1, 1, 1, 1, 1]
+    quorum = 6
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    expected_output = np.array([2 / 9] + [7 / 72] * 8)
+    actual_output = shapley.compute(game=game)
+    assert np.array_equal(expected_output, actual_output)
+
+    # Special case: An infinite quorum, which is never reached.
+    weights = [1, 2, 3]
+    quorum = float("inf")
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    expected_output = np.array([0, 0, 0])
+    actual_output = shapley.compute(game=game)
+    assert np.array_equal(expected_output, actual_output)
+
     # Edge case: 1 player
     weights = [1]
     quorum = 1
@@ -566,6 +661,50 @@ def test_shapley_shubik_index():
     assert np.array_equal(expected_output, actual_output)
 
 
+def test_shapley_shubik_index_approx():
+    # Instantiate instance of shapley shubik index.
+    shapley = ShapleyShubikIndex()
+
+    # Test usual case.
+    weights = [7, 3, 3]
+    quorum = 10
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    expected_output = np.array([2 / 3, 1 / 6, 1 / 6])
+    actual_output = shapley.compute_approx(game=game, n_samples=20000, seed=0)
+    assert np.allclose(expected_output, actual_output, atol=0.02)
+
+    # Fixed seeds reproduce the estimate.
+    assert np.array_equal(actual_output, shapley.compute_approx(game=game, n_samples=20000, seed=0))
+
+    # Special case: The first player is pivot player in its one coalition, which is not counted like in the exact index.
+    weights = [6, 1, 1, 1, 1]
+    quorum = 6
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    expected_output = shapley.compute(game=game)
+    actual_output = shapley.compute_approx(game=game, n_samples=20000, seed=1)
+    assert np.allclose(expected_output, actual_output, atol=0.02)
+
+    # Large game: Too many players to enumerate the coalitions, which are not built for the estimate.
+    weights = [1] * 40
+    quorum = 21
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    expected_output = np.full(40, 1 / 40)
+    actual_output = shapley.compute_approx(game=game, n_samples=20000, seed=2)
+    assert np.allclose(expected_output, actual_output, atol=0.005)
+    assert np.isclose(np.sum(actual_output), 1)
+
+    # Edge case: 1 player
+    weights = [1]
+    quorum = 1
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    expected_output = [1]
+    actual_output = shapley.compute_approx(game=game)
+    assert np.array_equal(expected_output, actual_output)
+
+    with pytest.raises(ValueError):
+        shapley.compute_approx(game=game, n_samples=0)
+
+
 def test_banzhaf_index():
     # Instantiate instance of banzhaf index.
     banzhaf = BanzhafIndex()
@@ -594,6 +733,14 @@ def test_banzhaf_index():
     actual_output = banzhaf.compute(game=game)
     assert np.array_equal(expected_output, actual_output)
 
+    # Special case: Many players with small weights, counting the pivot players over the weights.
+    weights = [2, 1, 1, 1, 1, 1, 1, 1, 1]
+    quorum = 6
+    game = WeightedVotingGame(contributions=weights, quorum=quorum)
+    expected_output = np.array([9 / 41] + [4 / 41] * 8)
+    actual_output = banzhaf.compute(game=game)
+    assert np.array_equal(expected_output, actual_output)
+
     # Edge case: 1 player
     weights = [1]
     quorum = 1
@@ -1043,6 +1190,13 @@ def test_holler_index():
     actual_output = holler.compute(game=game, normalized=True)
     assert np.array_equal(expected_output, actual_output)
 
+    # Modifying the returned indices does not affect later computations.
+    actual_output = holler.compute(game=game, normalized=False)
+    actual_output[0] = 999
+    expected_output = np.array([1, 1, 0])
+    actual_output = holler.compute(game=game, normalized=False)
+    assert np.array_equal(expected_output, actual_output)
+
     weights = [2, 1, 1, 1]
     quorum = 5
     game = WeightedVotingGame(contributions=weights, quorum=quorum)
@@ -1144,3 +1298,22 @@ def test_deegan_packel_index():
     expected_output = np.zeros((1,))
     actual_output = dpi.compute(game=game, normalized=True)
     assert np.array_equal(expected_output, actual_output)
+
+
+def test_numpy_fallback(monkeypatch):
+    """Test that the numpy implementations agree with the compiled kernels, which are used if numba is installed."""
+    games = [([7, 3, 3], 10), ([8, 4, 1], 10), ([2, 1, 1, 1], 5), ([50, 30, 20, 0], 51), ([4, 3, 2, 1], 6)]
+    indices = [ShapleyShubikIndex(), BanzhafIndex(), SolidarityValue()]
+
+    def evaluate(weights, quorum):
+        game = WeightedVotingGame(contributions=weights, quorum=quorum)
+        return [game.get_winning_coalitions(), game.get_pivot_players(), game.null_players()], \
+            [index.compute(game=game) for index in indices]
+
+    expected_outputs = [evaluate(weights, quorum) for weights, quorum in games]
+    monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+    actual_outputs = [evaluate(weights, quorum) for weights, quorum in games]
+    for (expected_output, expected_indices), (actual_output, actual_indices) in zip(expected_outputs, actual_outputs):
+        assert expected_output == actual_output
+        for expected_index, actual_index in zip(expected_indices, actual_indices):
+            assert np.array_equal(expected_index, actual_index)